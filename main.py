@@ -1,21 +1,22 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 import asyncio
 import time
 import random
 import os
-from typing import Optional
+import base64
+import binascii
+import hmac
+from typing import List, Optional
 import jwt
 from pydantic import BaseModel
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Initialize FastAPI
 app = FastAPI(title="NetSuite API Simulation")
 
-# Simulated cache
-cache = {}
-
 # Auth token secret
 SECRET_KEY = "netsuite_simulation_secret"
+_JWT_KEY = SECRET_KEY.encode()
 
 # Customer tiers - simulating multi-tenancy
 CUSTOMER_TIERS = {
@@ -33,14 +34,16 @@ async def health_check():
     }
 
 # Authentication
+TOKEN_LIFETIME = 24 * 3600
+
 def create_token(customer_id: str, tier: str):
-    expiration = datetime.utcnow() + timedelta(hours=24)
+    expiration = int(time.time()) + TOKEN_LIFETIME
     payload = {
         "sub": customer_id,
         "tier": tier,
         "exp": expiration
     }
-    return jwt.encode(payload, SECRET_KEY, algorithm="HS256")
+    return jwt.encode(payload, _JWT_KEY, algorithm="HS256")
 
 def decode_token(token: str):
     try:
@@ -65,7 +68,10 @@ async def login(request: LoginRequest):
     if request.customer_id not in valid_customers:
         raise HTTPException(status_code=401, detail="Invalid customer ID")
     
-    if valid_customers[request.customer_id]["key"] != request.api_key:
+    if not hmac.compare_digest(
+        valid_customers[request.customer_id]["key"].encode(),
+        request.api_key.encode()
+    ):
         raise HTTPException(status_code=401, detail="Invalid API key")
     
     token = create_token(
@@ -75,42 +81,77 @@ async def login(request: LoginRequest):
     
     return {"access_token": token, "token_type": "bearer"}
 
+# Simulated inventory data - built once at import instead of per request
+_SEEDED_AT = datetime.now().isoformat()
+_INVENTORY = tuple(
+    {
+        "id": i,
+        "item_id": f"ITEM-{i}",
+        "name": f"Product {i}",
+        "quantity": random.randint(0, 1000),
+        "last_updated": _SEEDED_AT
+    }
+    for i in range(1000)
+)
+_BY_ITEM_ID = {item["item_id"]: item for item in _INVENTORY}
+
+# Inventory response models
+class InventoryItem(BaseModel):
+    id: int
+    item_id: str
+    name: str
+    quantity: int
+    last_updated: str
+
+class InventoryPage(BaseModel):
+    items: List[InventoryItem]
+    total: int
+    limit: int
+    next_cursor: Optional[str] = None
+
 # Sample API endpoints that simulate NetSuite behavior
-@app.get("/api/inventory")
+@app.get("/api/inventory", response_model=InventoryPage)
 async def get_inventory(
     request: Request,
     item_id: Optional[str] = None,
-    page: int = 1,
-    limit: int = 100
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000)
 ):
-    # Simulate data retrieval
-    items = []
-    for i in range(1000):
-        items.append({
-            "id": i,
-            "item_id": f"ITEM-{i}",
-            "name": f"Product {i}",
-            "quantity": random.randint(0, 1000),
-            "last_updated": datetime.now()
-        })
+    # Cursor pagination - resume after the last id of the previous page
+    last_id = -1
+    if after:
+        try:
+            last_id = int(base64.urlsafe_b64decode(after))
+        except (binascii.Error, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
     
     # Filter by item_id if provided
     if item_id:
-        items = [item for item in items if item['item_id'] == item_id]
+        item = _BY_ITEM_ID.get(item_id)
+        items = (item,) if item is not None else ()
+        paginated_items = (
+            (item,) if item is not None and item['id'] > last_id else ()
+        )
+    else:
+        # ids match tuple positions, so the cursor is a slice start
+        items = _INVENTORY
+        start = max(last_id + 1, 0)
+        paginated_items = items[start:start + limit]
     
-    # Pagination
-    start = (page - 1) * limit
-    end = start + limit
-    paginated_items = items[start:end]
+    next_cursor = None
+    if len(paginated_items) == limit:
+        next_cursor = base64.urlsafe_b64encode(
+            str(paginated_items[-1]['id']).encode()
+        ).decode()
     
     return {
         "items": paginated_items,
         "total": len(items),
-        "page": page,
         "limit": limit,
-        "pages": (len(items) + limit - 1) // limit
+        "next_cursor": next_cursor
     }
 
 if __name__ == "__main__":
     import uvicorn
+    # Single process; run multiple workers with `uvicorn main:app --workers N`
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file